@@ -1,23 +1,88 @@
 import os
+import io
+import contextlib
 import platform
 import psutil
 import datetime
 import time
 import sys
-import argparse
 import signal
+import socket
+import functools
+import heapq
 from tabulate import tabulate
 import matplotlib.pyplot as plt
 import numpy as np
-from collections import deque
+
+class RingBuffer:
+    """Fixed-size history of numeric samples backed by a preallocated NumPy array"""
+    def __init__(self, size, dtype=np.float32):
+        self.buf = np.zeros(size, dtype=dtype)
+        self.head = 0  # Index the next sample is written to
+        self.filled = 0
+        
+    def append(self, value):
+        """Stores a sample, overwriting the oldest one once the buffer is full
+        
+        Missing readings (None) are stored as NaN so gaps never need to be removed later.
+        """
+        self.buf[self.head] = np.nan if value is None else value
+        self.head = (self.head + 1) % len(self.buf)
+        if self.filled < len(self.buf):
+            self.filled += 1
+        
+    def as_array(self):
+        """Returns the stored samples as a contiguous array, oldest first
+        
+        Until the buffer wraps (and whenever the head is back at 0) this is a
+        view of the storage, so no copy is made.
+        """
+        if self.filled < len(self.buf):
+            return self.buf[:self.filled]
+        if self.head == 0:
+            return self.buf
+        return np.concatenate((self.buf[self.head:], self.buf[:self.head]))
+        
+    def __len__(self):
+        """Returns the number of stored samples"""
+        return self.filled
 
 # Global variables for resource history tracking
-cpu_history = deque(maxlen=60)
-memory_history = deque(maxlen=60)
-network_sent_history = deque(maxlen=60)
-network_recv_history = deque(maxlen=60)
-disk_io_read_history = deque(maxlen=60)
-disk_io_write_history = deque(maxlen=60)
+cpu_history = RingBuffer(60)
+memory_history = RingBuffer(60)
+# Byte counters are cumulative and outgrow float32 precision, so keep them as float64
+network_sent_history = RingBuffer(60, dtype=np.float64)
+network_recv_history = RingBuffer(60, dtype=np.float64)
+disk_io_read_history = RingBuffer(60, dtype=np.float64)
+disk_io_write_history = RingBuffer(60, dtype=np.float64)
+
+# Memory page size, used to convert page counts read from /proc into bytes
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+# Longest series drawn as-is; longer histories are downsampled (about twice a subplot's pixel width)
+MAX_GRAPH_POINTS = 1000
+
+# Static CPU topology never changes while running, so query it only once
+CPU_PHYSICAL_CORES = psutil.cpu_count(logical=False)
+CPU_LOGICAL_CORES = psutil.cpu_count(logical=True)
+
+# Shortest window that still gives a meaningful non-blocking CPU reading
+MIN_CPU_SAMPLE_WINDOW = 0.1
+
+# Prime psutil's CPU counters so later non-blocking calls measure real deltas
+psutil.cpu_percent(interval=None)
+psutil.cpu_percent(interval=None, percpu=True)
+last_cpu_sample = time.monotonic()
+
+# Mount points and interface addresses rarely change, so re-query them at most this often (seconds)
+QUERY_CACHE_TTL = 30
+query_cache = {}
+
+# Table style for tabulate output ("pretty" re-measures every cell for its box drawing)
+TABLE_FORMAT = "simple"
+
+# ANSI cursor-home + clear-to-end, used to redraw live views in place
+REDRAW_FRAME = "\x1b[H\x1b[J"
 
 class Spinner:
     """Simple spinner for showing progress"""
@@ -33,7 +98,41 @@ class Spinner:
 
 def clear_screen():
     """Clears the terminal screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if sys.stdout.isatty():
+        # Emit the ANSI sequence directly instead of spawning a shell
+        sys.stdout.write('\x1b[H\x1b[2J')
+        sys.stdout.flush()
+    else:
+        os.system('cls' if os.name == 'nt' else 'clear')
+
+def draw_frame(frame):
+    """Redraws the terminal in place with a fully composed frame"""
+    if sys.stdout.isatty():
+        # Move the cursor home and clear below it instead of clearing the whole screen
+        frame = REDRAW_FRAME + frame
+    
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        # Not backed by a file descriptor (e.g. redirected to a StringIO)
+        fd = None
+    
+    # The Windows console converts text to UTF-16 itself, so raw bytes would come out garbled
+    if fd is None or os.name == 'nt':
+        sys.stdout.write(frame)
+        sys.stdout.flush()
+        return
+    
+    # Encode once and hand the frame straight to the descriptor, bypassing the text layer
+    sys.stdout.flush()
+    data = memoryview(frame.encode(sys.stdout.encoding or "utf-8", sys.stdout.errors or "strict"))
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    except BlockingIOError:
+        # Non-blocking terminal is full; let the buffered layer queue the rest
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
 
 def show_ascii_art():
     """Displays the ASCII art for the system monitor"""
@@ -50,8 +149,9 @@ def show_ascii_art():
     print("System Monitoring Tool".center(100))
     print("=" * 100 + "\n")
 
-def get_system_info():
-    """Retrieves basic system information"""
+@functools.lru_cache(maxsize=1)
+def get_static_system_info():
+    """Retrieves system information that does not change while running (cached)"""
     info = {}
     info["system"] = platform.system()
     info["version"] = platform.version()
@@ -66,16 +166,22 @@ def get_system_info():
     elif platform.system() == "Linux":
         try:
             with open('/etc/os-release') as f:
-                lines = f.readlines()
-                for line in lines:
-                    if line.startswith('PRETTY_NAME='):
-                        info["linux_distro"] = line.split('=')[1].strip().strip('"')
-                        break
+                data = f.read()
+            # Scan the whole file once instead of splitting it into lines
+            _, found, rest = ('\n' + data).partition('\nPRETTY_NAME=')
+            if found:
+                info["linux_distro"] = rest.split('\n', 1)[0].strip().strip('"')
         except:
             info["linux_distro"] = "Unknown"
     elif platform.system() == "Darwin":
         info["mac_version"] = platform.mac_ver()[0]
     
+    return info
+
+def get_system_info():
+    """Retrieves basic system information"""
+    info = dict(get_static_system_info())
+    
     # Get boot time
     try:
         boot_time = datetime.datetime.fromtimestamp(psutil.boot_time())
@@ -90,20 +196,35 @@ def get_system_info():
     
     return info
 
+def cached_query(name, func, ttl=QUERY_CACHE_TTL):
+    """Returns the result of func(), calling it again only once the cached value is older than ttl seconds"""
+    now = time.monotonic()
+    entry = query_cache.get(name)
+    if entry is None or now - entry[0] > ttl:
+        entry = (now, func())
+        query_cache[name] = entry
+    return entry[1]
+
 def get_resource_usage():
     """Retrieves current resource usage statistics"""
+    global last_cpu_sample
     resources = {}
     
-    # CPU
-    resources["cpu_percent"] = psutil.cpu_percent(interval=1)
-    resources["cpu_freq"] = psutil.cpu_freq().current if hasattr(psutil.cpu_freq(), 'current') else "N/A"
-    resources["cpu_physical_cores"] = psutil.cpu_count(logical=False)
-    resources["cpu_logical_cores"] = psutil.cpu_count(logical=True)
-    
-    # Get per-core usage
-    resources["per_core_percent"] = psutil.cpu_percent(interval=0.1, percpu=True)
-    
-    # CPU temperature (if available)
+    # CPU (non-blocking: usage is measured since the previous sample)
+    elapsed = time.monotonic() - last_cpu_sample
+    if elapsed < MIN_CPU_SAMPLE_WINDOW:
+        time.sleep(MIN_CPU_SAMPLE_WINDOW - elapsed)
+    resources["cpu_percent"] = psutil.cpu_percent(interval=None)
+    resources["per_core_percent"] = psutil.cpu_percent(interval=None, percpu=True)
+    last_cpu_sample = time.monotonic()
+    
+    freq = psutil.cpu_freq()
+    resources["cpu_freq"] = getattr(freq, 'current', "N/A")
+    resources["cpu_physical_cores"] = CPU_PHYSICAL_CORES
+    resources["cpu_logical_cores"] = CPU_LOGICAL_CORES
+    
+    # CPU temperature (if available); keep the raw reading for threshold checks
+    resources["cpu_temp_c"] = None
     if hasattr(psutil, "sensors_temperatures"):
         try:
             temps = psutil.sensors_temperatures()
@@ -111,12 +232,13 @@ def get_resource_usage():
                 for name, entries in temps.items():
                     for entry in entries:
                         if entry.current > 0:  # Filter out zero readings
-                            resources["cpu_temp"] = f"{entry.current}°C"
+                            resources["cpu_temp_c"] = entry.current
                             break
+                    if resources["cpu_temp_c"] is not None:
+                        break
         except:
-            resources["cpu_temp"] = "N/A"
-    else:
-        resources["cpu_temp"] = "N/A"
+            resources["cpu_temp_c"] = None
+    resources["cpu_temp"] = f"{resources['cpu_temp_c']}°C" if resources["cpu_temp_c"] is not None else "N/A"
     
     # Memory
     mem = psutil.virtual_memory()
@@ -133,7 +255,7 @@ def get_resource_usage():
     
     # Disk
     disks = []
-    for partition in psutil.disk_partitions():
+    for partition in cached_query("disk_partitions", psutil.disk_partitions):
         try:
             usage = psutil.disk_usage(partition.mountpoint)
             disks.append({
@@ -190,10 +312,11 @@ def get_resource_usage():
     
     # Network interfaces
     resources["network_interfaces"] = []
+    af_inet = socket.AF_INET
     try:
-        for interface_name, interface_addresses in psutil.net_if_addrs().items():
+        for interface_name, interface_addresses in cached_query("net_if_addrs", psutil.net_if_addrs).items():
             for address in interface_addresses:
-                if address.family == socket.AF_INET:
+                if address.family == af_inet:
                     resources["network_interfaces"].append({
                         "interface": interface_name,
                         "ip": address.address,
@@ -224,7 +347,7 @@ def get_resource_usage():
         resources["battery_time_left"] = "N/A"
     
     # Processes
-    resources["total_processes"] = len(list(psutil.process_iter()))
+    resources["total_processes"] = len(psutil.pids())
     
     # Update history data
     cpu_history.append(resources["cpu_percent"])
@@ -253,28 +376,41 @@ def get_top_processes(sort_by="cpu"):
     else:
         sort_key = "memory_percent"
     
-    for proc in sorted(
-        psutil.process_iter(['pid', 'name', 'username', 'cpu_percent', 'memory_percent', 'status', 'create_time']), 
-        key=lambda p: p.info[sort_key], 
-        reverse=True
-    )[:15]:  # Get top 15 processes
+    # Collect the sortable attributes of every process from a single procfs snapshot
+    candidates = []
+    for proc in psutil.process_iter():
+        try:
+            with proc.oneshot():
+                info = proc.as_dict(
+                    attrs=['pid', 'name', 'username', 'cpu_percent', 'memory_percent', 'status', 'create_time'],
+                    ad_value=None
+                )
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            continue
+        candidates.append((proc, info))
+    
+    # Get top 15 processes without sorting the full process list
+    top = heapq.nlargest(15, candidates, key=lambda c: c[1][sort_key] or 0)
+    
+    for proc, info in top:
         try:
             # Get process creation time
-            create_time = datetime.datetime.fromtimestamp(proc.info['create_time']).strftime("%Y-%m-%d %H:%M")
+            create_time = datetime.datetime.fromtimestamp(info['create_time']).strftime("%Y-%m-%d %H:%M")
             
             # Get command line (first 30 chars)
             try:
-                cmdline = " ".join(proc.cmdline())[:30] + ('...' if len(" ".join(proc.cmdline())) > 30 else '')
+                full_cmdline = " ".join(proc.cmdline())
+                cmdline = full_cmdline[:30] + ('...' if len(full_cmdline) > 30 else '')
             except:
                 cmdline = "N/A"
                 
             processes.append({
-                "pid": proc.info['pid'],
-                "name": proc.info['name'],
-                "user": proc.info['username'],
-                "status": proc.info['status'],
-                "cpu_percent": proc.info['cpu_percent'],
-                "memory_percent": proc.info['memory_percent'],
+                "pid": info['pid'],
+                "name": info['name'],
+                "user": info['username'],
+                "status": info['status'],
+                "cpu_percent": info['cpu_percent'],
+                "memory_percent": info['memory_percent'],
                 "created": create_time,
                 "command": cmdline
             })
@@ -283,105 +419,133 @@ def get_top_processes(sort_by="cpu"):
     
     return processes
 
-def check_system_issues(resources):
-    """Checks for potential system issues based on thresholds"""
-    issues = []
+def get_network_connections():
+    """Retrieves current inet connections along with the owning process name"""
+    raw_connections = psutil.net_connections(kind='inet')
     
-    # High CPU usage
-    if resources["cpu_percent"] > 85:
-        issues.append({
-            "severity": "HIGH",
-            "component": "CPU",
-            "message": f"CPU usage is critically high at {resources['cpu_percent']}%."
-        })
-    elif resources["cpu_percent"] > 70:
-        issues.append({
-            "severity": "MEDIUM",
-            "component": "CPU",
-            "message": f"CPU usage is elevated at {resources['cpu_percent']}%."
-        })
-    
-    # Low memory
-    free_mem_percent = 100 - resources["mem_percent"]
-    if free_mem_percent < 10:
-        issues.append({
-            "severity": "HIGH",
-            "component": "Memory",
-            "message": f"Available memory is critically low at {free_mem_percent}% free."
-        })
-    elif free_mem_percent < 20:
-        issues.append({
-            "severity": "MEDIUM",
-            "component": "Memory",
-            "message": f"Available memory is running low at {free_mem_percent}% free."
-        })
+    # Resolve each owning PID's name once, and only for PIDs that actually hold sockets
+    pid_names = {}
+    for pid in {conn.pid for conn in raw_connections if conn.pid}:
+        try:
+            pid_names[pid] = psutil.Process(pid).name()
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            pass
     
-    # High swap usage
-    if resources["swap_percent"] > 80:
-        issues.append({
-            "severity": "MEDIUM",
-            "component": "Swap",
-            "message": f"Swap memory usage is high at {resources['swap_percent']}%, which may impact system performance."
+    connections = []
+    sock_stream = socket.SOCK_STREAM
+    for conn in raw_connections:
+        connections.append({
+            "protocol": "TCP" if conn.type == sock_stream else "UDP",
+            "local_addr": f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else "N/A",
+            "remote_addr": f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else "N/A",
+            "status": conn.status,
+            "pid": conn.pid,
+            "process_name": (pid_names.get(conn.pid) or "N/A") if conn.pid else "N/A"
         })
     
-    # Low disk space
-    for disk in resources["disks"]:
-        if disk["percent"] > 90:
-            issues.append({
-                "severity": "HIGH",
-                "component": "Disk",
-                "message": f"Critically low disk space on {disk['mountpoint']} ({disk['percent']}% used, only {format_bytes(disk['free'])} free)."
-            })
-        elif disk["percent"] > 80:
+    return connections
+
+# Threshold tables for check_system_issues, checked before and after the disks:
+# (component, value key, HIGH threshold, MEDIUM threshold, True if low values are the problem)
+RESOURCE_ISSUE_THRESHOLDS = (
+    ("CPU", "cpu_percent", 85, 70, False),
+    ("Memory", "mem_free_percent", 10, 20, True),
+    ("Swap", "swap_percent", None, 80, False),
+)
+HARDWARE_ISSUE_THRESHOLDS = (
+    ("Battery", "battery_percent", 15, 30, True),
+    ("Temperature", "cpu_temp_c", 85, 75, False),
+)
+
+# Issue messages by (component, severity), filled in with the checked values
+ISSUE_MESSAGES = {
+    ("CPU", "HIGH"): "CPU usage is critically high at {cpu_percent}%.",
+    ("CPU", "MEDIUM"): "CPU usage is elevated at {cpu_percent}%.",
+    ("Memory", "HIGH"): "Available memory is critically low at {mem_free_percent}% free.",
+    ("Memory", "MEDIUM"): "Available memory is running low at {mem_free_percent}% free.",
+    ("Swap", "MEDIUM"): "Swap memory usage is high at {swap_percent}%, which may impact system performance.",
+    ("Disk", "HIGH"): "Critically low disk space on {mountpoint} ({percent}% used, only {free} free).",
+    ("Disk", "MEDIUM"): "Low disk space on {mountpoint} ({percent}% used, {free} free).",
+    ("Battery", "HIGH"): "Battery level is critically low at {battery_percent}%. Connect to a power source soon.",
+    ("Battery", "MEDIUM"): "Battery level is low at {battery_percent}%.",
+    ("Temperature", "HIGH"): "CPU temperature is critically high at {cpu_temp}.",
+    ("Temperature", "MEDIUM"): "CPU temperature is elevated at {cpu_temp}.",
+}
+
+def threshold_severity(value, high, medium, below=False):
+    """Returns "HIGH" or "MEDIUM" if value crosses the matching threshold, otherwise None"""
+    if value is None:
+        return None
+    
+    if below:
+        if high is not None and value < high:
+            return "HIGH"
+        if value < medium:
+            return "MEDIUM"
+    else:
+        if high is not None and value > high:
+            return "HIGH"
+        if value > medium:
+            return "MEDIUM"
+    return None
+
+def append_threshold_issues(issues, thresholds, values):
+    """Appends an issue for every row of a threshold table that values cross"""
+    for component, key, high, medium, below in thresholds:
+        severity = threshold_severity(values[key], high, medium, below)
+        if severity:
             issues.append({
-                "severity": "MEDIUM",
-                "component": "Disk",
-                "message": f"Low disk space on {disk['mountpoint']} ({disk['percent']}% used, {format_bytes(disk['free'])} free)."
+                "severity": severity,
+                "component": component,
+                "message": ISSUE_MESSAGES[component, severity].format_map(values)
             })
+
+def check_system_issues(resources):
+    """Checks for potential system issues based on thresholds"""
+    issues = []
     
-    # Battery check
-    if resources["battery_percent"] != "N/A" and not resources["battery_power_plugged"]:
-        if resources["battery_percent"] < 15:
-            issues.append({
-                "severity": "HIGH",
-                "component": "Battery",
-                "message": f"Battery level is critically low at {resources['battery_percent']}%. Connect to a power source soon."
-            })
-        elif resources["battery_percent"] < 30:
-            issues.append({
-                "severity": "MEDIUM",
-                "component": "Battery",
-                "message": f"Battery level is low at {resources['battery_percent']}%."
-            })
+    # Values to check; None means the metric is unavailable or does not apply
+    battery_on_power = resources["battery_percent"] == "N/A" or resources["battery_power_plugged"]
+    values = {
+        "cpu_percent": resources["cpu_percent"],
+        "mem_free_percent": 100 - resources["mem_percent"],
+        "swap_percent": resources["swap_percent"],
+        "battery_percent": None if battery_on_power else resources["battery_percent"],
+        "cpu_temp_c": resources["cpu_temp_c"],
+        "cpu_temp": resources["cpu_temp"],
+    }
+    
+    append_threshold_issues(issues, RESOURCE_ISSUE_THRESHOLDS, values)
+    
+    # Low disk space (compare all partitions at once, then only visit the flagged ones)
+    disks = resources["disks"]
+    disk_percents = np.array([disk["percent"] for disk in disks], dtype=np.float64)
+    for i in np.nonzero(disk_percents > 80)[0]:
+        disk = disks[i]
+        severity = threshold_severity(disk["percent"], 90, 80)
+        issues.append({
+            "severity": severity,
+            "component": "Disk",
+            "message": ISSUE_MESSAGES["Disk", severity].format_map(dict(disk, free=format_bytes(disk["free"])))
+        })
     
-    # High temperature check
-    if resources["cpu_temp"] != "N/A":
-        temp = float(resources["cpu_temp"].replace("°C", ""))
-        if temp > 85:
-            issues.append({
-                "severity": "HIGH",
-                "component": "Temperature",
-                "message": f"CPU temperature is critically high at {resources['cpu_temp']}."
-            })
-        elif temp > 75:
-            issues.append({
-                "severity": "MEDIUM",
-                "component": "Temperature",
-                "message": f"CPU temperature is elevated at {resources['cpu_temp']}."
-            })
+    append_threshold_issues(issues, HARDWARE_ISSUE_THRESHOLDS, values)
     
     return issues
 
+# Units for format_bytes, one per power of 1024
+BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+@functools.lru_cache(maxsize=4096)
 def format_bytes(bytes_value):
     """Converts bytes to a human-readable format (KB, MB, GB, etc.)"""
     if bytes_value == "N/A":
         return "N/A"
     
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024:
-            return f"{bytes_value:.2f} {unit}"
-        bytes_value /= 1024
-    return f"{bytes_value:.2f} PB"
+    # Each unit step is 10 bits, so the bit length selects the unit directly
+    n = int(bytes_value)
+    shift = min((n.bit_length() - 1) // 10, len(BYTE_UNITS) - 1) if n > 0 else 0
+    return f"{bytes_value / (1 << (shift * 10)):.2f} {BYTE_UNITS[shift]}"
 
 def format_rate(bytes_value, time_sec=1):
     """Formats a rate (bytes per second) into a human-readable format"""
@@ -439,7 +603,8 @@ def show_resource_usage(resources, previous_resources=None):
     print(f"Cores: {resources['cpu_physical_cores']} physical, {resources['cpu_logical_cores']} logical")
     
     # Show per-core usage
-    cores_str = " ".join([f"Core {i}: {p}%" for i, p in enumerate(resources['per_core_percent'])])
+    cores = resources['per_core_percent']
+    cores_str = " ".join(map("Core {}: {}%".format, range(len(cores)), cores))
     print(f"Per-core Usage: {cores_str}")
     
     print(f"\nTotal Memory: {format_bytes(resources['mem_total'])}")
@@ -491,10 +656,8 @@ def show_processes(processes, sort_by="cpu"):
     print(f"\n--- TOP PROCESSES (Sorted by {sort_by.upper()}) ---")
     
     headers = ["PID", "Name", "User", "Status", "CPU %", "Memory %", "Created", "Command"]
-    table_data = []
-    
-    for p in processes:
-        table_data.append([
+    table_data = [
+        [
             p["pid"],
             p["name"],
             p["user"],
@@ -503,9 +666,16 @@ def show_processes(processes, sort_by="cpu"):
             f"{p['memory_percent']:.1f}",
             p["created"],
             p["command"]
-        ])
+        ]
+        for p in processes
+    ]
     
-    print(tabulate(table_data, headers=headers, tablefmt="pretty"))
+    # Values are already formatted, so skip tabulate's number detection pass
+    sys.stdout.write(tabulate(table_data, headers=headers, tablefmt=TABLE_FORMAT, disable_numparse=True) + "\n")
+
+# Fixed-width row templates for the report tables (a precision on a string field truncates it)
+PROCESS_REPORT_ROW = "{pid:<7} {name:<20.20} {user:<15.15} {status:<10.10} {cpu_percent:<8.1f} {memory_percent:<10.1f} {created:<16} {command:<40.40}\n"
+CONNECTION_REPORT_ROW = "{:<8} {:<25.25} {:<25.25} {:<15.15} {:<7} {:<20.20}\n"
 
 def generate_report():
     """Generates a complete report and saves it to a file"""
@@ -533,23 +703,10 @@ def generate_report():
     print(f"\rPlease wait {spinner.next()}", end="", flush=True)
     
     # Get network connections
-    network_connections = []
     try:
-        for conn in psutil.net_connections(kind='inet'):
-            try:
-                process = psutil.Process(conn.pid) if conn.pid else None
-                network_connections.append({
-                    "protocol": "TCP" if conn.type == socket.SOCK_STREAM else "UDP",
-                    "local_addr": f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else "N/A",
-                    "remote_addr": f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else "N/A",
-                    "status": conn.status,
-                    "pid": conn.pid,
-                    "process_name": process.name() if process else "N/A"
-                })
-            except:
-                pass
+        network_connections = get_network_connections()
     except:
-        pass
+        network_connections = []
     
     print(f"\rPlease wait {spinner.next()}", end="", flush=True)
     
@@ -568,7 +725,8 @@ def generate_report():
     
     print(f"\rWriting report... ", end="", flush=True)
     
-    with open(filename, 'w', encoding='utf-8') as f:
+    # Compose the whole report in memory so it reaches the file in a single write
+    with io.StringIO() as f:
         f.write("=" * 80 + "\n")
         f.write("SYSTEM STATUS REPORT\n")
         f.write(f"Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
@@ -662,16 +820,14 @@ def generate_report():
         f.write("TOP PROCESSES BY CPU USAGE\n")
         f.write("-" * 30 + "\n")
         f.write(f"{'PID':<7} {'Name':<20} {'User':<15} {'Status':<10} {'CPU %':<8} {'Memory %':<10} {'Created':<16} {'Command':<40}\n")
-        for p in cpu_processes:
-            f.write(f"{p['pid']:<7} {p['name'][:20]:<20} {p['user'][:15]:<15} {p['status'][:10]:<10} {p['cpu_percent']:<8.1f} {p['memory_percent']:<10.1f} {p['created']:<16} {p['command'][:40]:<40}\n")
+        f.writelines([PROCESS_REPORT_ROW.format_map(p) for p in cpu_processes])
         f.write("\n")
         
         # Top processes by memory
         f.write("TOP PROCESSES BY MEMORY USAGE\n")
         f.write("-" * 30 + "\n")
         f.write(f"{'PID':<7} {'Name':<20} {'User':<15} {'Status':<10} {'CPU %':<8} {'Memory %':<10} {'Created':<16} {'Command':<40}\n")
-        for p in memory_processes:
-            f.write(f"{p['pid']:<7} {p['name'][:20]:<20} {p['user'][:15]:<15} {p['status'][:10]:<10} {p['cpu_percent']:<8.1f} {p['memory_percent']:<10.1f} {p['created']:<16} {p['command'][:40]:<40}\n")
+        f.writelines([PROCESS_REPORT_ROW.format_map(p) for p in memory_processes])
         f.write("\n")
         
         # Network connections
@@ -679,8 +835,13 @@ def generate_report():
         f.write("-" * 30 + "\n")
         if network_connections:
             f.write(f"{'Protocol':<8} {'Local Address':<25} {'Remote Address':<25} {'Status':<15} {'PID':<7} {'Process':<20}\n")
-            for conn in network_connections[:30]:  # Limit to 30 connections
-                f.write(f"{conn['protocol']:<8} {conn['local_addr'][:25]:<25} {conn['remote_addr'][:25]:<25} {conn['status'][:15]:<15} {conn['pid'] if conn['pid'] else 'N/A':<7} {conn['process_name'][:20]:<20}\n")
+            f.writelines([
+                CONNECTION_REPORT_ROW.format(
+                    conn['protocol'], conn['local_addr'], conn['remote_addr'], conn['status'],
+                    conn['pid'] if conn['pid'] else 'N/A', conn['process_name']
+                )
+                for conn in network_connections[:30]  # Limit to 30 connections
+            ])
         else:
             f.write("No network connections information available.\n")
         f.write("\n")
@@ -694,6 +855,11 @@ def generate_report():
                 f.write(f"{user['name'][:20]:<20} {user['terminal'][:15]:<15} {user['host'][:30]:<30} {user['started']:<20}\n")
         else:
             f.write("No user login information available.\n")
+        
+        report_text = f.getvalue()
+    
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write(report_text)
     
     print(f"\rReport generated and saved as: {filename}    ")
     return filename
@@ -707,86 +873,245 @@ def monitor_live():
         print("\nPress Ctrl+C to stop monitoring...")
         time.sleep(1)
         
+        next_update = time.monotonic()
         while True:
-            clear_screen()
+            # Wake on a fixed cadence, so sampling and drawing time is not added to the interval
+            next_update += interval
             resources = get_resource_usage()
             
-            print("--- LIVE SYSTEM MONITORING ---")
-            print(f"Press Ctrl+C to stop | Last update: {datetime.datetime.now().strftime('%H:%M:%S')}")
-            
-            show_resource_usage(resources, previous_resources)
+            # Capture the display into one frame so it is drawn with a single write
+            with contextlib.redirect_stdout(io.StringIO()) as frame:
+                print("--- LIVE SYSTEM MONITORING ---")
+                print(f"Press Ctrl+C to stop | Last update: {datetime.datetime.now().strftime('%H:%M:%S')}")
+                
+                show_resource_usage(resources, previous_resources)
+            draw_frame(frame.getvalue())
             
             # Keep track of previous resources for rate calculations
             previous_resources = resources
             
-            time.sleep(interval)
+            delay = next_update - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # This update overran its slot; restart the cadence from now
+                next_update -= delay
     except KeyboardInterrupt:
         print("\nMonitoring stopped.")
 
+# Process states from /proc/<pid>/stat, named the way psutil reports them
+PROC_STATUS_NAMES = {
+    "R": psutil.STATUS_RUNNING,
+    "S": psutil.STATUS_SLEEPING,
+    "D": psutil.STATUS_DISK_SLEEP,
+    "T": psutil.STATUS_STOPPED,
+    "t": psutil.STATUS_TRACING_STOP,
+    "Z": psutil.STATUS_ZOMBIE,
+    "X": psutil.STATUS_DEAD,
+    "x": psutil.STATUS_DEAD,
+    "W": psutil.STATUS_WAKING,
+    "I": psutil.STATUS_IDLE,
+    "P": psutil.STATUS_PARKED,
+}
+
+def read_proc_files(pid):
+    """Reads a process's stat, io and cmdline files straight from /proc (Linux only)
+    
+    Returns the raw readings; read_bytes/write_bytes are None when /proc/<pid>/io is not readable.
+    """
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read()
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            cmdline = f.read()
+    except (FileNotFoundError, ProcessLookupError):
+        raise psutil.NoSuchProcess(pid)
+    except PermissionError:
+        raise psutil.AccessDenied(pid)
+    
+    # The command name may contain spaces or parentheses, so split after its closing ')'
+    fields = stat[stat.rindex(b")") + 2:].split()
+    state = fields[0].decode()
+    info = {
+        "status": PROC_STATUS_NAMES.get(state, state),
+        "cpu_ticks": int(fields[11]) + int(fields[12]),  # utime + stime
+        "threads": int(fields[17]),
+        "start_ticks": int(fields[19]),  # start time since boot; changes if the PID is reused
+        "rss": int(fields[21]) * PAGE_SIZE,
+        "cmdline": cmdline.rstrip(b"\0").replace(b"\0", b" ").decode(errors="replace"),
+        "read_bytes": None,
+        "write_bytes": None,
+    }
+    
+    try:
+        with open(f"/proc/{pid}/io", "rb") as f:
+            io_fields = dict(line.split(b": ", 1) for line in f.read().splitlines())
+        info["read_bytes"] = int(io_fields[b"read_bytes"])
+        info["write_bytes"] = int(io_fields[b"write_bytes"])
+    except (FileNotFoundError, ProcessLookupError):
+        raise psutil.NoSuchProcess(pid)
+    except PermissionError:
+        # Only the process owner (or root) may read its I/O counters
+        pass
+    
+    return info
+
+class ProcessSampler:
+    """Collects the per-update readings for monitor_process
+    
+    On Linux the readings come from three /proc files per update; elsewhere, or if those
+    files cannot be parsed, they come from a single psutil as_dict() call.
+    """
+    def __init__(self, process):
+        self.process = process
+        self.use_procfs = sys.platform.startswith("linux")
+        
+        # Attributes read by the psutil path (io_counters is not available on every platform)
+        self.attrs = ['cpu_percent', 'memory_percent', 'memory_info', 'status', 'num_threads', 'cmdline']
+        if hasattr(process, 'io_counters'):
+            self.attrs.append('io_counters')
+        
+        # Take the first CPU reading so the first sample already covers a real interval
+        if self.use_procfs:
+            self.clock_ticks = os.sysconf("SC_CLK_TCK")
+            self.total_memory = psutil.virtual_memory().total
+            try:
+                info = read_proc_files(process.pid)
+                self.start_ticks = info["start_ticks"]
+                self.last_ticks = info["cpu_ticks"]
+                self.last_time = time.monotonic()
+            except (ValueError, IndexError, KeyError):
+                self.use_psutil()
+        else:
+            self.use_psutil()
+        
+    def use_psutil(self):
+        """Switches to the psutil path and primes its CPU counter"""
+        self.use_procfs = False
+        self.process.cpu_percent(interval=None)
+        
+    def sample(self):
+        """Returns the current readings of the process as a dict"""
+        if self.use_procfs:
+            try:
+                return self.sample_procfs()
+            except (ValueError, IndexError, KeyError):
+                # Unexpected /proc format; use psutil from now on
+                self.use_psutil()
+        return self.sample_psutil()
+        
+    def sample_procfs(self):
+        """Builds the readings from /proc, computing CPU usage from the tick delta"""
+        info = read_proc_files(self.process.pid)
+        if info["start_ticks"] != self.start_ticks:
+            # The PID now belongs to a different process
+            raise psutil.NoSuchProcess(self.process.pid)
+        
+        now = time.monotonic()
+        cpu_seconds = (info["cpu_ticks"] - self.last_ticks) / self.clock_ticks
+        cpu_percent = round(cpu_seconds / (now - self.last_time) * 100, 1) if now > self.last_time else 0.0
+        self.last_ticks = info["cpu_ticks"]
+        self.last_time = now
+        
+        info["cpu_percent"] = cpu_percent
+        info["memory_percent"] = info["rss"] / self.total_memory * 100
+        return info
+        
+    def sample_psutil(self):
+        """Builds the readings from one batched psutil call (as_dict reads inside oneshot())"""
+        info = self.process.as_dict(attrs=self.attrs, ad_value=None)
+        if info['cpu_percent'] is None or info['memory_info'] is None:
+            raise psutil.AccessDenied(self.process.pid)
+        
+        io_counters = info.get('io_counters')
+        return {
+            "status": info['status'],
+            "cpu_percent": info['cpu_percent'],
+            "memory_percent": info['memory_percent'],
+            "threads": info['num_threads'],
+            "rss": info['memory_info'].rss,
+            "cmdline": " ".join(info['cmdline']) if info['cmdline'] is not None else "N/A",
+            "read_bytes": io_counters.read_bytes if io_counters else None,
+            "write_bytes": io_counters.write_bytes if io_counters else None,
+        }
+
+# Text of each monitor_process frame, filled in with str.format_map
+PROCESS_FRAME_TEMPLATE = (
+    "--- MONITORING PROCESS: {name} (PID: {pid}) ---\n"
+    "Press Ctrl+C to stop | Last update: {now}\n"
+    "\n"
+    "Status: {status}\n"
+    "CPU Usage: {cpu_percent}%\n"
+    "Memory Usage: {memory_percent:.2f}% ({rss})\n"
+    "Created: {created}\n"
+    "Running Time: {days} days, {hours} hours, {minutes} minutes, {seconds} seconds\n"
+    "Threads: {threads}\n"
+    "{io}"
+    "\n"
+    "Command Line: {cmdline}\n"
+    "\n"
+    "CPU Usage History (last 60 seconds):\n"
+    "{cpu_graph}"
+    "\n"
+    "Memory Usage History (last 60 seconds):\n"
+    "{memory_graph}"
+)
+PROCESS_IO_TEMPLATE = "I/O - Read: {}\nI/O - Written: {}\n"
+
 def monitor_process():
     """Monitors a specific process by PID"""
     try:
         pid = int(input("\nEnter the Process ID (PID) to monitor: "))
         process = psutil.Process(pid)
+        proc_name = process.name()
+        create_ts = process.create_time()
+        create_time = datetime.datetime.fromtimestamp(create_ts).strftime("%Y-%m-%d %H:%M:%S")
+        sampler = ProcessSampler(process)
         
-        print(f"\nMonitoring process: {process.name()} (PID: {pid})")
+        print(f"\nMonitoring process: {proc_name} (PID: {pid})")
         print("Press Ctrl+C to stop monitoring...")
         time.sleep(1)
         
         interval = 1  # Update every second
         
-        # Create history deques for this process
-        process_cpu_history = deque(maxlen=60)
-        process_memory_history = deque(maxlen=60)
+        # Create history buffers for this process
+        process_cpu_history = RingBuffer(60)
+        process_memory_history = RingBuffer(60)
         
         while True:
-            clear_screen()
             try:
                 # Get process info
-                with process.oneshot():
-                    cpu_percent = process.cpu_percent(interval=0.1)
-                    memory_percent = process.memory_percent()
-                    memory_info = process.memory_info()
-                    status = process.status()
-                    create_time = datetime.datetime.fromtimestamp(process.create_time()).strftime("%Y-%m-%d %H:%M:%S")
-                    running_time = datetime.datetime.now() - datetime.datetime.fromtimestamp(process.create_time())
-                    hours, remainder = divmod(running_time.seconds, 3600)
-                    minutes, seconds = divmod(remainder, 60)
-                    running_time_str = f"{running_time.days} days, {hours} hours, {minutes} minutes, {seconds} seconds"
-                    io_counters = process.io_counters() if hasattr(process, 'io_counters') else None
-                    threads = process.num_threads()
-                    try:
-                        cmdline = " ".join(process.cmdline())
-                    except:
-                        cmdline = "N/A"
-                    
-                    # Update history
-                    process_cpu_history.append(cpu_percent)
-                    process_memory_history.append(memory_percent)
+                info = sampler.sample()
                 
-                print(f"--- MONITORING PROCESS: {process.name()} (PID: {pid}) ---")
-                print(f"Press Ctrl+C to stop | Last update: {datetime.datetime.now().strftime('%H:%M:%S')}")
-                
-                print(f"\nStatus: {status}")
-                print(f"CPU Usage: {cpu_percent}%")
-                print(f"Memory Usage: {memory_percent:.2f}% ({format_bytes(memory_info.rss)})")
-                print(f"Created: {create_time}")
-                print(f"Running Time: {running_time_str}")
-                print(f"Threads: {threads}")
-                
-                if io_counters:
-                    print(f"I/O - Read: {format_bytes(io_counters.read_bytes)}")
-                    print(f"I/O - Written: {format_bytes(io_counters.write_bytes)}")
+                # Update history
+                process_cpu_history.append(info['cpu_percent'])
+                process_memory_history.append(info['memory_percent'])
                 
-                print(f"\nCommand Line: {cmdline}")
+                days, remainder = divmod(int(time.time() - create_ts), 86400)
+                hours, remainder = divmod(remainder, 3600)
+                minutes, seconds = divmod(remainder, 60)
                 
-                # Show mini CPU history graph using ASCII
-                print("\nCPU Usage History (last 60 seconds):")
-                show_ascii_graph(process_cpu_history, 50, 25)
+                if info['read_bytes'] is not None:
+                    io_lines = PROCESS_IO_TEMPLATE.format(format_bytes(info['read_bytes']), format_bytes(info['write_bytes']))
+                else:
+                    io_lines = ""
                 
-                # Show mini memory history graph using ASCII
-                print("\nMemory Usage History (last 60 seconds):")
-                show_ascii_graph(process_memory_history, 50, 25)
+                # Fill the whole frame from one template so it is drawn with a single write
+                draw_frame(PROCESS_FRAME_TEMPLATE.format_map(dict(
+                    info,
+                    name=proc_name,
+                    pid=pid,
+                    now=datetime.datetime.now().strftime('%H:%M:%S'),
+                    rss=format_bytes(info['rss']),
+                    created=create_time,
+                    days=days,
+                    hours=hours,
+                    minutes=minutes,
+                    seconds=seconds,
+                    io=io_lines,
+                    cpu_graph=render_ascii_graph(process_cpu_history.as_array(), 50, 25),
+                    memory_graph=render_ascii_graph(process_memory_history.as_array(), 50, 25),
+                )))
                 
                 time.sleep(interval)
             except psutil.NoSuchProcess:
@@ -797,35 +1122,48 @@ def monitor_process():
                 break
     except psutil.NoSuchProcess:
         print(f"\nProcess with PID {pid} not found.")
+    except psutil.AccessDenied:
+        print(f"\nAccess denied to process with PID {pid}.")
     except ValueError:
         print("\nInvalid PID.")
     except KeyboardInterrupt:
         print("\nMonitoring stopped.")
 
-def show_ascii_graph(data, width=50, height=10):
-    """Displays an ASCII graph of the given data"""
-    if not data:
-        print("No data available")
-        return
+# Code points for filled and empty ASCII graph cells
+GRAPH_BAR_CODE = ord("█")
+GRAPH_BLANK_CODE = ord(" ")
+
+def render_ascii_graph(data, width=50, height=10):
+    """Returns an ASCII graph of the given data as a string"""
+    if len(data) == 0:
+        return "No data available\n"
     
-    # Create y-axis labels
-    max_val = max(data) if data else 0
-    min_val = min(data) if data else 0
+    values = np.asarray(data, dtype=np.float64)
+    missing = np.isnan(values)
+    if missing.all():
+        return "No data available\n"
+    lines = []
+    
+    # Create y-axis labels (ignoring missing samples)
+    max_val = np.nanmax(values)
+    min_val = np.nanmin(values)
     
     # Ensure we don't divide by zero
     if max_val == min_val:
         max_val += 1
     
+    # Compare every value against every row threshold in one broadcast
+    levels = np.arange(height, 0, -1)
+    thresholds = min_val + (max_val - min_val) * levels[:, None] / height
+    
+    # Fill the grid with code points and view each row as one fixed-width string,
+    # so no per-cell Python work is left
+    filled = (values[None, :] >= thresholds) & ~missing[None, :]
+    codes = np.where(filled, GRAPH_BAR_CODE, GRAPH_BLANK_CODE).astype(np.uint32)
+    rows = codes.view(f"U{len(values)}")[:, 0]
+    
     # Create the graph
-    for h in range(height, 0, -1):
-        threshold = min_val + (max_val - min_val) * h / height
-        row = ""
-        for value in data:
-            if value >= threshold:
-                row += "█"
-            else:
-                row += " "
-        
+    for h, row in zip(levels, rows):
         # Add y-axis label
         if h == height:
             label = f"{max_val:.1f}%"
@@ -837,14 +1175,53 @@ def show_ascii_graph(data, width=50, height=10):
         else:
             label = "       "
         
-        print(f"{label} |{row}")
+        lines.append(f"{label} |{row}")
     
     # Add x-axis
-    print("       " + "-" * len(data))
+    lines.append(f"       {'-' * len(data)}")
     
     # Add time markers
     if len(data) > 10:
-        print("       " + "0s" + " " * (len(data) - 8) + f"-{len(data)}s")
+        lines.append(f"       0s{' ' * (len(data) - 8)}-{len(data)}s")
+    
+    return "\n".join(lines) + "\n"
+
+def downsample_lttb(x, y, n_out):
+    """Reduces a series to n_out points with Largest-Triangle-Three-Buckets, keeping its visual shape"""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+    
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    
+    # The first and last samples are always kept; the rest are split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0] = 0
+    keep[-1] = n - 1
+    
+    prev = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        
+        # Average of the following bucket (just the last sample for the final bucket)
+        next_start, next_end = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        
+        # Keep the point forming the largest triangle with the previous pick and that average
+        areas = np.abs((x[prev] - avg_x) * (y[start:end] - y[prev]) - (x[prev] - x[start:end]) * (avg_y - y[prev]))
+        prev = start + int(np.argmax(areas))
+        keep[i + 1] = prev
+    
+    return x[keep], y[keep]
+
+def plot_graph_data(ax, x, y, *args, **kwargs):
+    """Plots a graph line, downsampling series too long to be drawn usefully"""
+    if len(x) > MAX_GRAPH_POINTS:
+        x, y = downsample_lttb(x, y, MAX_GRAPH_POINTS)
+    ax.plot(x, y, *args, **kwargs)
 
 def plot_resource_graphs():
     """Generates and displays graphs of resource usage"""
@@ -860,17 +1237,17 @@ def plot_resource_graphs():
     fig.suptitle('System Resource Usage History')
     
     # Time axis (last 60 points)
-    time_labels = list(range(-len(cpu_history) + 1, 1))
+    time_labels = np.arange(-len(cpu_history) + 1, 1)
     
     # Create CPU usage graph
-    axs[0, 0].plot(time_labels, list(cpu_history), 'b-', linewidth=2)
+    plot_graph_data(axs[0, 0], time_labels, cpu_history.as_array(), 'b-', linewidth=2)
     axs[0, 0].set_title('CPU Usage (%)')
     axs[0, 0].set_ylim(0, 100)
     axs[0, 0].set_xlabel('Time (seconds)')
     axs[0, 0].grid(True)
     
     # Create memory usage graph
-    axs[0, 1].plot(time_labels, list(memory_history), 'r-', linewidth=2)
+    plot_graph_data(axs[0, 1], time_labels, memory_history.as_array(), 'r-', linewidth=2)
     axs[0, 1].set_title('Memory Usage (%)')
     axs[0, 1].set_ylim(0, 100)
     axs[0, 1].set_xlabel('Time (seconds)')
@@ -879,12 +1256,12 @@ def plot_resource_graphs():
     # Create network usage graph if we have data
     if network_sent_history:
         # Convert to KB/s for better readability
-        sent_kb = [b/1024 for b in calculate_deltas(network_sent_history)]
-        received_kb = [b/1024 for b in calculate_deltas(network_recv_history)]
+        sent_kb = calculate_deltas(network_sent_history.as_array()) / 1024.0
+        received_kb = calculate_deltas(network_recv_history.as_array()) / 1024.0
         
-        net_time_labels = list(range(-len(sent_kb) + 1, 1))
-        axs[1, 0].plot(net_time_labels, sent_kb, 'g-', label='Upload')
-        axs[1, 0].plot(net_time_labels, received_kb, 'm-', label='Download')
+        net_time_labels = np.arange(-len(sent_kb) + 1, 1)
+        plot_graph_data(axs[1, 0], net_time_labels, sent_kb, 'g-', label='Upload')
+        plot_graph_data(axs[1, 0], net_time_labels, received_kb, 'm-', label='Download')
         axs[1, 0].set_title('Network Usage (KB/s)')
         axs[1, 0].set_xlabel('Time (seconds)')
         axs[1, 0].grid(True)
@@ -896,12 +1273,12 @@ def plot_resource_graphs():
     # Create disk I/O graph if we have data
     if disk_io_read_history:
         # Convert to KB/s for better readability
-        read_kb = [b/1024 for b in calculate_deltas(disk_io_read_history)]
-        write_kb = [b/1024 for b in calculate_deltas(disk_io_write_history)]
+        read_kb = calculate_deltas(disk_io_read_history.as_array()) / 1024.0
+        write_kb = calculate_deltas(disk_io_write_history.as_array()) / 1024.0
         
-        io_time_labels = list(range(-len(read_kb) + 1, 1))
-        axs[1, 1].plot(io_time_labels, read_kb, 'c-', label='Read')
-        axs[1, 1].plot(io_time_labels, write_kb, 'y-', label='Write')
+        io_time_labels = np.arange(-len(read_kb) + 1, 1)
+        plot_graph_data(axs[1, 1], io_time_labels, read_kb, 'c-', label='Read')
+        plot_graph_data(axs[1, 1], io_time_labels, write_kb, 'y-', label='Write')
         axs[1, 1].set_title('Disk I/O (KB/s)')
         axs[1, 1].set_xlabel('Time (seconds)')
         axs[1, 1].grid(True)
@@ -913,36 +1290,20 @@ def plot_resource_graphs():
     plt.tight_layout(rect=[0, 0.03, 1, 0.95])
     plt.show()
 
-def calculate_deltas(data_history):
-    """Calculate the delta between consecutive measurements"""
-    if len(data_history) < 2:
-        return []
-    
-    result = []
-    for i in range(1, len(data_history)):
-        result.append(data_history[i] - data_history[i-1])
+def calculate_deltas(data_history, interval=1):
+    """Calculate the delta (per interval) between consecutive measurements"""
+    values = np.fromiter(data_history, dtype=np.float64, count=len(data_history))
+    if values.size < 2:
+        return np.empty(0)
     
-    return result
+    return np.diff(values) / interval
 
 def show_network_connections():
     """Displays current network connections"""
     print("\n--- NETWORK CONNECTIONS ---")
     
     try:
-        connections = []
-        for conn in psutil.net_connections(kind='inet'):
-            try:
-                process = psutil.Process(conn.pid) if conn.pid else None
-                connections.append({
-                    "protocol": "TCP" if conn.type == socket.SOCK_STREAM else "UDP",
-                    "local_addr": f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else "N/A",
-                    "remote_addr": f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else "N/A",
-                    "status": conn.status,
-                    "pid": conn.pid,
-                    "process_name": process.name() if process else "N/A"
-                })
-            except:
-                pass
+        connections = get_network_connections()
         
         if connections:
             headers = ["Protocol", "Local Address", "Remote Address", "Status", "PID", "Process"]
@@ -958,7 +1319,7 @@ def show_network_connections():
                     conn['process_name']
                 ])
             
-            print(tabulate(table_data, headers=headers, tablefmt="pretty"))
+            print(tabulate(table_data, headers=headers, tablefmt=TABLE_FORMAT))
             print(f"\nTotal connections: {len(connections)}")
         else:
             print("No network connections information available.")
@@ -977,18 +1338,22 @@ def show_disk_io_stats():
             headers = ["Device", "Read Count", "Read Bytes", "Read Time", "Write Count", "Write Bytes", "Write Time"]
             table_data = []
             
+            # Every device's counters share one platform-specific layout, so check the fields once
+            sample = next(iter(disk_io.values()))
+            has_times = hasattr(sample, 'read_time') and hasattr(sample, 'write_time')
+            
             for device, stats in disk_io.items():
                 table_data.append([
                     device,
                     stats.read_count,
                     format_bytes(stats.read_bytes),
-                    f"{stats.read_time}ms" if hasattr(stats, 'read_time') else "N/A",
+                    f"{stats.read_time}ms" if has_times else "N/A",
                     stats.write_count,
                     format_bytes(stats.write_bytes),
-                    f"{stats.write_time}ms" if hasattr(stats, 'write_time') else "N/A"
+                    f"{stats.write_time}ms" if has_times else "N/A"
                 ])
             
-            print(tabulate(table_data, headers=headers, tablefmt="pretty"))
+            print(tabulate(table_data, headers=headers, tablefmt=TABLE_FORMAT))
             
             # Get disk partitions
             print("\n--- DISK PARTITIONS ---")
@@ -1004,7 +1369,7 @@ def show_disk_io_stats():
                     part.opts
                 ])
             
-            print(tabulate(table_data, headers=headers, tablefmt="pretty"))
+            print(tabulate(table_data, headers=headers, tablefmt=TABLE_FORMAT))
         else:
             print("No disk I/O information available.")
     except:
@@ -1029,7 +1394,7 @@ def show_system_issues(resources):
                 issue["message"]
             ])
         
-        print(tabulate(table_data, headers=headers, tablefmt="pretty"))
+        print(tabulate(table_data, headers=headers, tablefmt=TABLE_FORMAT))
         
         # Provide recommendations
         print("\nRecommendations:")
@@ -1059,35 +1424,63 @@ def signal_handler(sig, frame):
     print("\nExiting...")
     sys.exit(0)
 
+def show_current_issues():
+    """Checks the current resource usage for issues"""
+    show_system_issues(get_resource_usage())
+
+def show_top_processes():
+    """Asks for a sort order and displays the top processes"""
+    sort_option = input("\nSort by (1) CPU or (2) Memory? [1/2]: ")
+    sort_by = "memory" if sort_option == "2" else "cpu"
+    show_processes(get_top_processes(sort_by=sort_by), sort_by=sort_by)
+
+def save_report():
+    """Generates a report and tells the user where it was saved"""
+    report_file = generate_report()
+    input(f"\nReport saved to {report_file}. Press Enter to continue...")
+
+# Main menu dispatch table: option -> (action, wait for Enter afterwards)
+MENU_ACTIONS = {
+    '1': (lambda: show_system_info(get_system_info()), True),
+    '2': (monitor_live, False),
+    '3': (show_current_issues, True),
+    '4': (show_top_processes, True),
+    '5': (save_report, False),
+    '6': (plot_resource_graphs, False),
+    '7': (monitor_process, False),
+    '8': (show_network_connections, True),
+    '9': (show_disk_io_stats, True),
+}
+
 def main():
     """Main function"""
     # Register signal handler for graceful exit
     signal.signal(signal.SIGINT, signal_handler)
     
-    # Parse command line arguments
-    parser = argparse.ArgumentParser(description='Advanced System Monitor')
-    parser.add_argument('-m', '--monitor', action='store_true', help='Start live monitoring immediately')
-    parser.add_argument('-r', '--report', action='store_true', help='Generate a report immediately')
-    parser.add_argument('-i', '--info', action='store_true', help='Show system information and exit')
-    args = parser.parse_args()
-    
-    # Handle command line arguments
-    if args.monitor:
-        monitor_live()
-        return
-    elif args.report:
-        generate_report()
-        return
-    elif args.info:
-        show_system_info(get_system_info())
-        input("\nPress Enter to exit...")
-        return
-    
-    # Import all required modules
-    try:
-        import socket
-    except ImportError:
-        print("Warning: socket module not available, some features may be limited.")
+    # Enable ANSI escape processing in the Windows 10+ console
+    if os.name == 'nt':
+        os.system('')
+    
+    # Parse command line arguments (argparse is only imported when some were given)
+    if len(sys.argv) > 1:
+        import argparse
+        parser = argparse.ArgumentParser(description='Advanced System Monitor')
+        parser.add_argument('-m', '--monitor', action='store_true', help='Start live monitoring immediately')
+        parser.add_argument('-r', '--report', action='store_true', help='Generate a report immediately')
+        parser.add_argument('-i', '--info', action='store_true', help='Show system information and exit')
+        args = parser.parse_args()
+        
+        # Handle command line arguments
+        if args.monitor:
+            monitor_live()
+            return
+        elif args.report:
+            generate_report()
+            return
+        elif args.info:
+            show_system_info(get_system_info())
+            input("\nPress Enter to exit...")
+            return
     
     # Main program loop
     while True:
@@ -1099,36 +1492,17 @@ def main():
         if choice == '0':
             print("\nExiting...")
             break
-        elif choice == '1':
-            show_system_info(get_system_info())
-            input("\nPress Enter to continue...")
-        elif choice == '2':
-            monitor_live()
-        elif choice == '3':
-            resources = get_resource_usage()
-            show_system_issues(resources)
-            input("\nPress Enter to continue...")
-        elif choice == '4':
-            sort_option = input("\nSort by (1) CPU or (2) Memory? [1/2]: ")
-            sort_by = "memory" if sort_option == "2" else "cpu"
-            show_processes(get_top_processes(sort_by=sort_by), sort_by=sort_by)
-            input("\nPress Enter to continue...")
-        elif choice == '5':
-            report_file = generate_report()
-            input(f"\nReport saved to {report_file}. Press Enter to continue...")
-        elif choice == '6':
-            plot_resource_graphs()
-        elif choice == '7':
-            monitor_process()
-        elif choice == '8':
-            show_network_connections()
-            input("\nPress Enter to continue...")
-        elif choice == '9':
-            show_disk_io_stats()
-            input("\nPress Enter to continue...")
-        else:
+        
+        action = MENU_ACTIONS.get(choice)
+        if action is None:
             print("\nInvalid choice. Please try again.")
             time.sleep(1)
+            continue
+        
+        handler, wait_for_enter = action
+        handler()
+        if wait_for_enter:
+            input("\nPress Enter to continue...")
 
 if __name__ == "__main__":
     main()